@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
 import sys
 import threading
 import typing
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from typing_extensions import TypedDict as _TypedDict
 
@@ -13,9 +19,10 @@ if sys.version_info < (3, 12):
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 
 from src.shl_recommender.agent.chat_agent import ChatAgent
+from src.shl_recommender.config import get_settings
 from src.shl_recommender.data_models import (
     ASSESSMENT_TYPE_LABELS,
     ChatRequest,
@@ -24,37 +31,161 @@ from src.shl_recommender.data_models import (
     RecommendationRequest,
     RecommendationResponse,
 )
-from src.shl_recommender.recommender import RecommendationEngine
+from src.shl_recommender.recommender import CandidatePool, RecommendationEngine
+
+# Embedding + vector search is CPU-bound; run it on a bounded pool so the event
+# loop stays free, and cap in-flight work so queued requests wait here instead
+# of piling up inside the executor.
+_RECOMMEND_WORKERS = os.cpu_count() or 1
+executor = ThreadPoolExecutor(max_workers=_RECOMMEND_WORKERS, thread_name_prefix="recommend")
+_slots_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _recommend_slots() -> asyncio.Semaphore:
+    """Per-event-loop slot semaphore; a module-level one binds to the first loop that waits."""
+    loop = asyncio.get_running_loop()
+    slots = _slots_by_loop.get(loop)
+    if slots is None:
+        slots = _slots_by_loop[loop] = asyncio.Semaphore(_RECOMMEND_WORKERS)
+    return slots
+
+
+# lru_cache does not serialize concurrent misses, so the outer caches give a
+# lock-free fast path while construction happens once, under the lock, in the
+# inner builders. Reentrant because building the chat agent needs the engine.
+_singleton_lock = threading.RLock()
 
-_engine: RecommendationEngine | None = None
-_chat_agent: ChatAgent | None = None
-_engine_lock = threading.Lock()
 
+@lru_cache(maxsize=1)
+def _build_engine() -> RecommendationEngine:
+    return RecommendationEngine()
 
+
+@lru_cache(maxsize=1)
+def _build_chat_agent() -> ChatAgent:
+    return ChatAgent(engine=get_engine())
+
+
+@lru_cache(maxsize=1)
 def get_engine() -> RecommendationEngine:
-    global _engine
-    if _engine is None:
-        with _engine_lock:
-            if _engine is None:
-                _engine = RecommendationEngine()
-    return _engine
+    """Return the per-process engine (embedding model + vector index loaded once)."""
+    with _singleton_lock:
+        return _build_engine()
 
 
+@lru_cache(maxsize=1)
 def get_chat_agent() -> ChatAgent:
-    global _chat_agent
-    if _chat_agent is None:
-        with _engine_lock:
-            if _chat_agent is None:
-                _chat_agent = ChatAgent(engine=get_engine())
-    return _chat_agent
+    with _singleton_lock:
+        return _build_chat_agent()
+
+
+def _reset_singletons() -> None:
+    with _singleton_lock:
+        for cached in (get_chat_agent, _build_chat_agent, get_engine, _build_engine):
+            cached.cache_clear()
+
+
+class RecommendationBatcher:
+    """Coalesce concurrent /recommend queries into one embedding + vector search call.
+
+    Requests arriving within ``max_wait_ms`` of each other (up to ``max_batch``)
+    share a single encoder forward pass and a single Chroma query; each caller
+    then ranks its own candidates.
+    """
+
+    def __init__(self, max_batch: int, max_wait_ms: float) -> None:
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[RecommendationEngine, str, asyncio.Future]] | None = None
+        self._worker: asyncio.Task | None = None
+
+    def _ensure_worker(self) -> asyncio.Queue[tuple[RecommendationEngine, str, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def submit(self, engine: RecommendationEngine, query: str) -> CandidatePool:
+        """Retrieve candidates for ``query`` from ``engine`` as part of the next batch."""
+        queue = self._ensure_worker()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await queue.put((engine, query, future))
+        return await future
+
+    async def stop(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._loop = self._queue = self._worker = None
+
+    async def _run(self, queue: asyncio.Queue[tuple[RecommendationEngine, str, asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: list[tuple[RecommendationEngine, str, asyncio.Future]]) -> None:
+        # Requests carry the engine they were resolved with (Depends(get_engine), so
+        # dependency overrides apply); each distinct engine gets one batched call.
+        groups: dict[int, list[tuple[RecommendationEngine, str, asyncio.Future]]] = {}
+        for item in batch:
+            groups.setdefault(id(item[0]), []).append(item)
+        for group in groups.values():
+            await self._dispatch_group(group[0][0], group)
+
+    async def _dispatch_group(
+        self,
+        engine: RecommendationEngine,
+        group: list[tuple[RecommendationEngine, str, asyncio.Future]],
+    ) -> None:
+        queries = [query for _, query, _ in group]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                executor,
+                engine.retrieve_candidates_batch,
+                queries,
+            )
+        except Exception as exc:
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, _, future), candidates in zip(group, results):
+            if not future.done():
+                future.set_result(candidates)
+
+
+_settings = get_settings()
+_batcher = RecommendationBatcher(
+    max_batch=_settings.recommend_batch_max_size,
+    max_wait_ms=_settings.recommend_batch_max_wait_ms,
+)
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
+    # Warm the engine and its (otherwise lazily loaded) embedding model before
+    # accepting traffic so the first request is not cold.
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, get_chat_agent)
+    await loop.run_in_executor(executor, lambda: get_engine().embedder)
     yield
-    global _engine, _chat_agent
-    _engine = None
-    _chat_agent = None
+    await _batcher.stop()
+    _reset_singletons()
 
 
 app = FastAPI(title="SHL Assessment Recommender", version="2.0.0", lifespan=lifespan)
@@ -67,12 +198,20 @@ def health_check() -> dict:
 
 
 @app.post("/recommend", response_model=RecommendationResponse)
-def recommend(request: RecommendationRequest) -> RecommendationResponse:
+async def recommend(
+    request: RecommendationRequest,
+    engine: RecommendationEngine = Depends(get_engine),
+) -> RecommendationResponse:
     query = request.query.strip()
     if not query:
         raise HTTPException(status_code=400, detail="Query must not be empty.")
 
-    result = get_engine().recommend(query)
+    candidates = await _batcher.submit(engine, query)
+    async with _recommend_slots():
+        result = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(engine.recommend, query, candidates=candidates),
+        )
     categories = [
         ExtractedCategory(code=code, label=ASSESSMENT_TYPE_LABELS.get(code, code))
         for code in result.extracted_types
@@ -84,6 +223,6 @@ def recommend(request: RecommendationRequest) -> RecommendationResponse:
 
 
 @app.post("/chat", response_model=ChatResponse)
-def chat(request: ChatRequest) -> ChatResponse:
+def chat(request: ChatRequest, agent: ChatAgent = Depends(get_chat_agent)) -> ChatResponse:
     """Stateless conversational endpoint; pass full message history each turn."""
-    return get_chat_agent().handle(request.messages)
+    return agent.handle(request.messages)
@@ -7,6 +7,8 @@ from typing import List
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 def _normalize_api_url(raw: str) -> str:
@@ -20,10 +22,29 @@ API_URL = _normalize_api_url(os.environ.get("RECOMMENDER_API_URL", "http://local
 MAX_MESSAGES = 8  # user + assistant turns combined (assignment limit)
 
 
-def fetch_chat_reply(messages: List[dict]) -> dict:
-    """Call the stateless /chat endpoint with full conversation history."""
-    response = requests.post(
-        f"{API_URL}/chat",
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Pooled HTTP session reused across Streamlit reruns (keeps backend connections alive)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def fetch_chat_reply(messages: List[dict], api_url: str) -> dict:
+    """Call the stateless /chat endpoint with full conversation history.
+
+    Cached per (history, API URL): /chat is stateless, so an identical history
+    always yields the same reply and reruns need not hit the backend again.
+    """
+    response = get_session().post(
+        f"{api_url}/chat",
         json={"messages": messages},
         timeout=90,
     )
@@ -84,7 +105,7 @@ if prompt := st.chat_input("Describe the role or assessment needs..."):
             with st.spinner("Thinking..."):
                 try:
                     payload = to_api_messages(st.session_state.messages)
-                    data = fetch_chat_reply(payload)
+                    data = fetch_chat_reply(payload, API_URL)
                     reply = data.get("reply", "")
                     recommendations = data.get("recommendations", [])
                     end_of_conversation = bool(data.get("end_of_conversation"))
@@ -143,6 +164,9 @@ with st.sidebar:
         os.environ["RECOMMENDER_API_URL"] = _normalize_api_url(api_url)
         st.rerun()
 
+    if st.button("🔄 Force refresh", help="Drop cached replies and query the backend again."):
+        fetch_chat_reply.clear()
+
     if st.button("🗑️ Clear Chat History"):
         st.session_state.messages = []
         st.rerun()
@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from pydantic import TypeAdapter
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from src.shl_recommender.data_models import RecommendationItem
 from src.shl_recommender.recommender import RecommendationEngine
 
+_ITEMS_JSON_ADAPTER = TypeAdapter(List[RecommendationItem])
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate SHL recommendations from an input dataset.")
@@ -47,20 +52,19 @@ def main() -> int:
     engine = RecommendationEngine()
 
     queries = list(load_queries(args.input, args.column))
-    results = []
-
-    for query in queries:
-        result = engine.recommend(query)
-        results.append(
-            {
-                args.column: query,
-                "extracted_categories": ", ".join(result.extracted_types),
-                "assessments": json.dumps([item.model_dump() for item in result.recommendations]),
-            }
-        )
-
-    output_df = pd.DataFrame(results)
-    output_df.to_csv(args.output, index=False)
+    predictions = engine.recommend_batch(queries)
+
+    # Build the output columns directly and let Arrow's C++ writer emit the CSV.
+    table = pa.table(
+        {
+            args.column: queries,
+            "extracted_categories": [", ".join(result.extracted_types) for result in predictions],
+            "assessments": [
+                _ITEMS_JSON_ADAPTER.dump_json(result.recommendations).decode() for result in predictions
+            ],
+        }
+    )
+    pa_csv.write_csv(table, args.output)
     print(f"Predictions saved to {args.output}")
 
     return 0
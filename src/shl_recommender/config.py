@@ -2,7 +2,7 @@
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,6 +29,10 @@ class Settings(BaseSettings):
         default=Path("data_pages"),
         description="Directory where raw catalog page HTML dumps are stored.",
     )
+    crawler_http_cache_path: Path = Field(
+        default=Path(".cache") / "shl_http_cache",
+        description="SQLite cache used by the crawler for conditional (ETag/Last-Modified) requests.",
+    )
     data_csv_path: Path = Field(
         default=Path("data") / "shl_individual_assessments.csv",
         description="Path to the catalog CSV generated by the crawler.",
@@ -41,18 +45,71 @@ class Settings(BaseSettings):
         default="sentence-transformers/all-MiniLM-L6-v2",
         description="SentenceTransformers model used for embedding generation.",
     )
+    embedding_device: Optional[str] = Field(
+        default=None,
+        description="Torch device for the embedding model; auto-detects cuda, then mps, then cpu.",
+    )
+    embedding_batch_size: int = Field(
+        default=128,
+        description="Batch size passed to SentenceTransformer.encode.",
+    )
     collection_name: str = Field(
         default="shl_assessments",
         description="Chroma collection name for assessment embeddings.",
     )
+    query_embedding_cache_size: int = Field(
+        default=512,
+        description="Number of recent query embeddings kept in the engine's LRU cache.",
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        description="Cosine similarity at which a new query reuses a cached query's candidates.",
+    )
+    semantic_cache_size: int = Field(
+        default=256,
+        description="Number of recent query embeddings kept in the semantic (near-duplicate) cache.",
+    )
+    semantic_cache_ttl_seconds: float = Field(
+        default=900.0,
+        description="Seconds a semantic cache entry stays eligible for reuse.",
+    )
     candidate_pool_size: int = Field(
         default=20,
         description="Number of candidates to retrieve from the vector store before ranking.",
     )
+    binary_prefilter_min_rows: int = Field(
+        default=10_000,
+        description=(
+            "Catalogs smaller than this are searched exactly with one inner-product pass; "
+            "larger ones use a binary Hamming shortlist before rescoring."
+        ),
+    )
+    vector_index_precision: Literal["float32", "float16", "int8"] = Field(
+        default="float32",
+        description=(
+            "Storage precision of the in-memory catalog matrix. Scores are computed in FP32, "
+            "so float16/int8 save memory but are upcast on every query (slower search)."
+        ),
+    )
+    vector_rescore_multiplier: int = Field(
+        default=4,
+        description=(
+            "Binary-quantized search shortlists candidate_pool_size times this many rows "
+            "before exact FP32 rescoring."
+        ),
+    )
     recommendation_limit: int = Field(
         default=10,
         description="Maximum number of assessments returned to clients.",
     )
+    recommend_batch_max_size: int = Field(
+        default=32,
+        description="Maximum number of concurrent /recommend queries embedded in one batch.",
+    )
+    recommend_batch_max_wait_ms: float = Field(
+        default=10.0,
+        description="How long the /recommend batcher waits for more queries before flushing.",
+    )
     gemini_api_key: Optional[str] = Field(
         default=None,
         alias="GEMINI_API_KEY",
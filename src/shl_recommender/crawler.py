@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import csv
-import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import logfire
+import orjson
 import requests
 from bs4 import BeautifulSoup
+from pydantic import TypeAdapter
+from requests_cache import CachedSession
 
 from .config import get_settings
 from .data_models import AssessmentMetadata
@@ -28,11 +34,25 @@ REQUEST_TIMEOUT = 30
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; SHLBot/1.0)"}
 EXPECTED_TOTAL_PAGES = 32
 REQUEST_DELAY_SECONDS = 0.1
+HTTP_CACHE_EXPIRE_SECONDS = 86400
+DETAIL_FETCH_WORKERS = 8
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+def _preferred_html_parser() -> str:
+    """Use the C-backed lxml parser when installed; fall back to the pure-Python one."""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+HTML_PARSER = _preferred_html_parser()
+
+
+@dataclass(frozen=True, slots=True)
 class CatalogRow:
     entity_id: str
     name: str
@@ -43,11 +63,82 @@ class CatalogRow:
 
 
 def _create_session() -> requests.Session:
-    session = requests.Session()
+    """HTTP session backed by an on-disk cache.
+
+    Responses are reused for a day (or per the server's Cache-Control), and stale
+    entries are revalidated with ETag / Last-Modified so unchanged pages come back
+    as 304s without re-downloading the body.
+    """
+    settings = get_settings()
+    cache_path = resolve_project_path(Path(settings.crawler_http_cache_path))
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    session = CachedSession(
+        str(cache_path),
+        backend="sqlite",
+        expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+        cache_control=True,
+    )
     session.headers.update(HEADERS)
     return session
 
 
+class _RateLimiter:
+    """Thread-safe limiter spacing request starts at least ``interval`` seconds apart."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _DetailFetcher:
+    """Fetch assessment detail pages concurrently over one pooled session.
+
+    Detail fetches are network-bound, so a small thread pool overlaps their
+    latency while the shared limiter keeps the overall request rate polite.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        *,
+        max_workers: int = DETAIL_FETCH_WORKERS,
+        limiter: _RateLimiter | None = None,
+    ) -> None:
+        self.session = session
+        self.limiter = limiter or _RateLimiter(REQUEST_DELAY_SECONDS)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shl-detail")
+
+    def _fetch(self, row: CatalogRow) -> dict:
+        self.limiter.wait()
+        try:
+            return _extract_detail_info(self.session, row.detail_url)
+        except requests.ConnectionError as exc:
+            raise CrawlerNetworkError(
+                f"Lost network while fetching detail page for {row.name!r}."
+            ) from exc
+
+    def fetch_all(self, rows: List[CatalogRow]) -> List[dict]:
+        return list(self._executor.map(self._fetch, rows))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "_DetailFetcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
 def _parse_boolean(cell: Optional[BeautifulSoup]) -> Optional[bool]:
     if not cell:
         return None
@@ -89,10 +180,24 @@ def _parse_row(tr: BeautifulSoup, base_url: str) -> CatalogRow:
 def _extract_detail_info(session: requests.Session, url: str) -> dict:
     response = session.get(url, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.text, HTML_PARSER)
+    try:
+        return _detail_info_from_soup(soup)
+    finally:
+        # BeautifulSoup trees are heavily cross-referenced; tear them down as soon
+        # as the extracted values (plain strings) are out.
+        soup.decompose()
+
+
+def _detail_info_from_soup(soup: BeautifulSoup) -> dict:
+    # Index every <h4> once instead of re-walking the tree for each heading lookup;
+    # the first heading with a given label wins, matching ``soup.find`` semantics.
+    headings: dict[str, BeautifulSoup] = {}
+    for tag in soup.find_all("h4"):
+        headings.setdefault(tag.get_text(strip=True).lower(), tag)
 
     def _text_after_heading(heading: str) -> Optional[str]:
-        header_tag = soup.find("h4", string=lambda value: isinstance(value, str) and value.strip().lower() == heading.lower())
+        header_tag = headings.get(heading.lower())
         if header_tag:
             value_tag = header_tag.find_next("p")
             if value_tag:
@@ -139,7 +244,14 @@ class CrawlerNetworkError(RuntimeError):
 
 
 def _parse_catalog_html(page_html: str) -> Tuple[List[CatalogRow], Optional[int]]:
-    soup = BeautifulSoup(page_html, "html.parser")
+    soup = BeautifulSoup(page_html, HTML_PARSER)
+    try:
+        return _catalog_rows_from_soup(soup)
+    finally:
+        soup.decompose()
+
+
+def _catalog_rows_from_soup(soup: BeautifulSoup) -> Tuple[List[CatalogRow], Optional[int]]:
     total_pages = _extract_total_pages(soup)
     table_candidates = soup.select("div.custom__table-wrapper table")
 
@@ -204,26 +316,20 @@ def _persist_page_html(page_html: str, pages_dir: Path, page_number: int) -> Pat
 
 def _rows_to_metadata(
     rows: Iterable[CatalogRow],
-    session: requests.Session,
+    fetcher: _DetailFetcher | None,
     *,
-    fetch_details: bool,
     seen_ids: set[str],
-    collected: List[AssessmentMetadata],
-) -> None:
+) -> Iterator[AssessmentMetadata]:
+    pending: List[CatalogRow] = []
     for row in rows:
         if row.entity_id in seen_ids:
             continue
+        seen_ids.add(row.entity_id)
+        pending.append(row)
 
-        detail_info: dict = {}
-        if fetch_details:
-            try:
-                detail_info = _extract_detail_info(session, row.detail_url)
-            except requests.ConnectionError as exc:
-                raise CrawlerNetworkError(
-                    f"Lost network while fetching detail page for {row.name!r}."
-                ) from exc
-            time.sleep(REQUEST_DELAY_SECONDS)
+    details = fetcher.fetch_all(pending) if fetcher else [{} for _ in pending]
 
+    for row, detail_info in zip(pending, details):
         metadata = AssessmentMetadata(
             entity_id=str(row.entity_id),
             name=row.name,
@@ -237,22 +343,24 @@ def _rows_to_metadata(
             adaptive=row.adaptive,
         )
 
-        collected.append(metadata)
-        seen_ids.add(row.entity_id)
         logfire.debug(
             "Collected assessment",
             entity_id=row.entity_id,
             name=row.name,
             assessment_types=list(row.assessment_types),
         )
+        yield metadata
 
 
 def crawl_catalog_from_cache(
     pages_dir: Path | None = None,
     *,
     fetch_details: bool = False,
-) -> List[AssessmentMetadata]:
-    """Build catalog from cached listing HTML in data_pages/ (no listing-page fetch)."""
+) -> Iterator[AssessmentMetadata]:
+    """Build catalog from cached listing HTML in data_pages/ (no listing-page fetch).
+
+    The cache directory is validated eagerly; records are then yielded lazily.
+    """
 
     configure_logging("shl-crawler")
     settings = get_settings()
@@ -263,34 +371,36 @@ def crawl_catalog_from_cache(
             f"No cached pages in {resolved_dir}. "
             "Run a full crawl when online, or copy data_pages/ from another machine."
         )
+    return _iter_cached_catalog(html_files, fetch_details=fetch_details)
 
-    session = _create_session() if fetch_details else None
-    collected: List[AssessmentMetadata] = []
+
+def _iter_cached_catalog(html_files: List[Path], *, fetch_details: bool) -> Iterator[AssessmentMetadata]:
+    fetcher = _DetailFetcher(_create_session()) if fetch_details else None
     seen_ids: set[str] = set()
+    total = 0
 
-    for html_path in html_files:
-        page_html = html_path.read_text(encoding="utf-8")
-        rows, _ = _parse_catalog_html(page_html)
-        logger.info("Parsed cached %s (%d rows)", html_path.name, len(rows))
-        if not rows:
-            continue
-        _rows_to_metadata(
-            rows,
-            session or _create_session(),
-            fetch_details=fetch_details,
-            seen_ids=seen_ids,
-            collected=collected,
-        )
+    try:
+        for html_path in html_files:
+            page_html = html_path.read_text(encoding="utf-8")
+            rows, _ = _parse_catalog_html(page_html)
+            logger.info("Parsed cached %s (%d rows)", html_path.name, len(rows))
+            if not rows:
+                continue
+            for metadata in _rows_to_metadata(rows, fetcher, seen_ids=seen_ids):
+                total += 1
+                yield metadata
+    finally:
+        if fetcher:
+            fetcher.close()
 
-    logfire.info("Offline cache crawl complete", total=len(collected), pages=len(html_files))
-    return collected
+    logfire.info("Offline cache crawl complete", total=total, pages=len(html_files))
 
 
 def import_catalog_from_json(json_path: str | Path) -> List[AssessmentMetadata]:
     """Load catalog records from an existing JSON export."""
 
     resolved = resolve_project_path(Path(json_path))
-    payload = json.loads(resolved.read_text(encoding="utf-8"))
+    payload = orjson.loads(resolved.read_bytes())
     records: List[AssessmentMetadata] = []
     for item in payload:
         types = item.get("assessment_types") or []
@@ -313,125 +423,175 @@ def import_catalog_from_json(json_path: str | Path) -> List[AssessmentMetadata]:
     return records
 
 
-def crawl_catalog(*, clear_page_cache: bool = False) -> List[AssessmentMetadata]:
-    """Crawl the SHL catalog and return metadata for individual assessments."""
+def crawl_catalog(*, clear_page_cache: bool = False) -> Iterator[AssessmentMetadata]:
+    """Crawl the SHL catalog, yielding metadata for individual assessments as pages complete."""
 
     configure_logging("shl-crawler")
     settings = get_settings()
     session = _create_session()
+    limiter = _RateLimiter(REQUEST_DELAY_SECONDS)
     pages_dir = resolve_project_path(Path(settings.data_pages_dir))
     _prepare_pages_dir(pages_dir, clear_cache=clear_page_cache)
 
-    collected: List[AssessmentMetadata] = []
     seen_ids: set[str] = set()
+    total = 0
 
     page_index = 0
     total_pages: Optional[int] = None
 
-    while page_index < EXPECTED_TOTAL_PAGES:
-        page_number = page_index + 1
-        url = _page_url(page_index)
-        logfire.info("Parsing page", page_index=page_index, url=url)
-        logger.info("Scraping page %d of %d from %s", page_number, EXPECTED_TOTAL_PAGES, url)
-
-        rows, detected_total_pages, page_html = _parse_catalog_page(session, url)
-        saved_path = _persist_page_html(page_html, pages_dir, page_number)
-        logger.info("Saved page %d HTML to %s", page_number, saved_path)
-
-        if detected_total_pages and detected_total_pages != total_pages:
-            total_pages = detected_total_pages
-            logfire.info("Detected catalog page count", total_pages=total_pages)
-            if total_pages < EXPECTED_TOTAL_PAGES:
-                logger.warning(
-                    "Detected only %d pages on the site, expected %d",
-                    total_pages,
-                    EXPECTED_TOTAL_PAGES,
-                )
-
-        logfire.info("Parsed page", page_index=page_index, url=url, row_count=len(rows))
-
-        if not rows:
-            logfire.warn("No rows found for catalog page", page_index=page_index, url=url)
-            logger.warning("No rows found on page %d; stopping crawl", page_number)
-            break
-
-        _rows_to_metadata(
-            rows,
-            session,
-            fetch_details=True,
-            seen_ids=seen_ids,
-            collected=collected,
-        )
-
-        page_index += 1
-        logger.info("Completed page %d with %d assessments", page_number, len(rows))
-        time.sleep(REQUEST_DELAY_SECONDS)
-
-    logfire.info("Crawl complete", total=len(collected), pages_visited=page_index)
+    with _DetailFetcher(session, limiter=limiter) as fetcher:
+        while page_index < EXPECTED_TOTAL_PAGES:
+            page_number = page_index + 1
+            url = _page_url(page_index)
+            logfire.info("Parsing page", page_index=page_index, url=url)
+            logger.info("Scraping page %d of %d from %s", page_number, EXPECTED_TOTAL_PAGES, url)
+
+            limiter.wait()
+            rows, detected_total_pages, page_html = _parse_catalog_page(session, url)
+            saved_path = _persist_page_html(page_html, pages_dir, page_number)
+            logger.info("Saved page %d HTML to %s", page_number, saved_path)
+
+            if detected_total_pages and detected_total_pages != total_pages:
+                total_pages = detected_total_pages
+                logfire.info("Detected catalog page count", total_pages=total_pages)
+                if total_pages < EXPECTED_TOTAL_PAGES:
+                    logger.warning(
+                        "Detected only %d pages on the site, expected %d",
+                        total_pages,
+                        EXPECTED_TOTAL_PAGES,
+                    )
+
+            logfire.info("Parsed page", page_index=page_index, url=url, row_count=len(rows))
+
+            if not rows:
+                logfire.warn("No rows found for catalog page", page_index=page_index, url=url)
+                logger.warning("No rows found on page %d; stopping crawl", page_number)
+                break
+
+            for metadata in _rows_to_metadata(rows, fetcher, seen_ids=seen_ids):
+                total += 1
+                yield metadata
+
+            page_index += 1
+            logger.info("Completed page %d with %d assessments", page_number, len(rows))
+
+    logfire.info("Crawl complete", total=total, pages_visited=page_index)
     if page_index < EXPECTED_TOTAL_PAGES:
         logger.warning(
             "Crawled %d pages, fewer than the expected %d",
             page_index,
             EXPECTED_TOTAL_PAGES,
         )
-    return collected
+
+
+CATALOG_CSV_FIELDS = [
+    "entity_id",
+    "name",
+    "url",
+    "assessment_types",
+    "description",
+    "job_levels",
+    "languages",
+    "assessment_length",
+    "remote_testing",
+    "adaptive",
+]
+
+
+class _CatalogCsvWriter:
+    """Append catalog records to an open CSV file one row at a time."""
+
+    def __init__(self, handle: IO[str]) -> None:
+        self._writer = csv.DictWriter(handle, fieldnames=CATALOG_CSV_FIELDS)
+        self._writer.writeheader()
+
+    def write(self, record: AssessmentMetadata) -> None:
+        self._writer.writerow(
+            {
+                "entity_id": record.entity_id,
+                "name": record.name,
+                "url": str(record.url),
+                "assessment_types": ",".join(sorted(record.assessment_types)),
+                "description": record.description or "",
+                "job_levels": ",".join(record.job_levels),
+                "languages": ",".join(record.languages),
+                "assessment_length": record.assessment_length or "",
+                "remote_testing": record.remote_testing,
+                "adaptive": record.adaptive,
+            }
+        )
+
+
+# Serializes a record straight to JSON bytes in pydantic-core, skipping the
+# intermediate ``model_dump`` dict.
+_RECORD_JSON_ADAPTER = TypeAdapter(AssessmentMetadata)
+
+
+class _CatalogJsonWriter:
+    """Stream catalog records into a JSON array (same layout as ``json.dump(..., indent=2)``)."""
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        self._count = 0
+        handle.write(b"[")
+
+    def write(self, record: AssessmentMetadata) -> None:
+        body = _RECORD_JSON_ADAPTER.dump_json(record, indent=2)
+        self._handle.write((b"\n  " if self._count == 0 else b",\n  ") + body.replace(b"\n", b"\n  "))
+        self._count += 1
+
+    def close(self) -> None:
+        self._handle.write(b"\n]" if self._count else b"]")
+
+
+def _resolve_output_path(output_path: Optional[str], default: Path) -> Path:
+    destination = resolve_project_path(Path(output_path or default))
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    return destination
+
+
+@contextmanager
+def _partial_output(destination: Path, *, binary: bool = False) -> Iterator[IO]:
+    """Stream into ``<destination>.partial`` and move it into place only on success.
+
+    A failed crawl leaves the previous catalog untouched and the rows gathered
+    so far in the ``.partial`` file.
+    """
+    partial = destination.with_name(destination.name + ".partial")
+    if binary:
+        handle = open(partial, "wb")
+    else:
+        handle = open(partial, "w", newline="", encoding="utf-8")
+    with handle:
+        yield handle
+    os.replace(partial, destination)
 
 
 def write_catalog_to_csv(records: Iterable[AssessmentMetadata], output_path: Optional[str] = None) -> str:
     """Persist catalog records to CSV and return the resolved path."""
 
-    settings = get_settings()
-    destination = str(resolve_project_path(Path(output_path or settings.data_csv_path)))
-    Path(destination).parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "entity_id",
-        "name",
-        "url",
-        "assessment_types",
-        "description",
-        "job_levels",
-        "languages",
-        "assessment_length",
-        "remote_testing",
-        "adaptive",
-    ]
-
-    with open(destination, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    destination = _resolve_output_path(output_path, get_settings().data_csv_path)
+    with _partial_output(destination) as csvfile:
+        writer = _CatalogCsvWriter(csvfile)
         for record in records:
-            writer.writerow(
-                {
-                    "entity_id": record.entity_id,
-                    "name": record.name,
-                    "url": str(record.url),
-                    "assessment_types": ",".join(sorted(record.assessment_types)),
-                    "description": record.description or "",
-                    "job_levels": ",".join(record.job_levels),
-                    "languages": ",".join(record.languages),
-                    "assessment_length": record.assessment_length or "",
-                    "remote_testing": record.remote_testing,
-                    "adaptive": record.adaptive,
-                }
-            )
+            writer.write(record)
 
-    logfire.info("Catalog written", path=destination)
-    return destination
+    logfire.info("Catalog written", path=str(destination))
+    return str(destination)
 
 
 def write_catalog_to_json(records: Iterable[AssessmentMetadata], output_path: Optional[str] = None) -> str:
     """Persist catalog records to JSON and return the resolved path."""
 
-    settings = get_settings()
-    destination = str(resolve_project_path(Path(output_path or settings.data_json_path)))
-    Path(destination).parent.mkdir(parents=True, exist_ok=True)
-    payload = [record.model_dump(mode="json") for record in records]
-
-    with open(destination, "w", encoding="utf-8") as jsonfile:
-        json.dump(payload, jsonfile, ensure_ascii=False, indent=2)
+    destination = _resolve_output_path(output_path, get_settings().data_json_path)
+    with _partial_output(destination, binary=True) as jsonfile:
+        writer = _CatalogJsonWriter(jsonfile)
+        for record in records:
+            writer.write(record)
+        writer.close()
 
-    logfire.info("Catalog JSON written", path=destination)
-    return destination
+    logfire.info("Catalog JSON written", path=str(destination))
+    return str(destination)
 
 
 def crawl_and_save(
@@ -443,8 +603,9 @@ def crawl_and_save(
     fetch_details_offline: bool = False,
     clear_page_cache: bool = False,
 ) -> Tuple[str, str]:
-    """Utility helper combining crawl and CSV persistence."""
+    """Crawl (or import) the catalog and stream each record to CSV and JSON as it arrives."""
 
+    records: Iterable[AssessmentMetadata]
     if from_json:
         records = import_catalog_from_json(from_json)
     elif offline:
@@ -452,7 +613,20 @@ def crawl_and_save(
     else:
         records = crawl_catalog(clear_page_cache=clear_page_cache)
 
-    csv_path = write_catalog_to_csv(records, output_path)
-    json_path = write_catalog_to_json(records, json_output_path)
-    return csv_path, json_path
+    settings = get_settings()
+    csv_path = _resolve_output_path(output_path, settings.data_csv_path)
+    json_path = _resolve_output_path(json_output_path, settings.data_json_path)
+
+    with ExitStack() as stack:
+        csvfile = stack.enter_context(_partial_output(csv_path))
+        jsonfile = stack.enter_context(_partial_output(json_path, binary=True))
+        csv_writer = _CatalogCsvWriter(csvfile)
+        json_writer = _CatalogJsonWriter(jsonfile)
+        for record in records:
+            csv_writer.write(record)
+            json_writer.write(record)
+        json_writer.close()
 
+    logfire.info("Catalog written", path=str(csv_path))
+    logfire.info("Catalog JSON written", path=str(json_path))
+    return str(csv_path), str(json_path)
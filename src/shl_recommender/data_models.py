@@ -8,6 +8,9 @@ from typing import List, Literal, Optional, Set
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
 
+_DURATION_RE = re.compile(r"(\d+)")
+
+
 ASSESSMENT_TYPE_LABELS = {
     "A": "Ability & Aptitude",
     "B": "Biodata & Situational Judgement",
@@ -45,31 +48,20 @@ class AssessmentMetadata(BaseModel):
     def combined_text(self) -> str:
         """Build a single text blob for embedding."""
 
-        sections = [self.name]
-        if self.description:
-            sections.append(self.description)
-        if self.job_levels:
-            sections.append("Job Levels: " + ", ".join(self.job_levels))
-        if self.languages:
-            sections.append("Languages: " + ", ".join(self.languages))
-        if self.assessment_length:
-            sections.append(f"Assessment Length: {self.assessment_length}")
-        if self.assessment_types:
-            sections.append("Types: " + ", ".join(sorted(self.assessment_types)))
-        return "\n".join(sections)
+        optional_sections = (
+            ("", self.description),
+            ("Job Levels: ", ", ".join(self.job_levels)),
+            ("Languages: ", ", ".join(self.languages)),
+            ("Assessment Length: ", self.assessment_length),
+            ("Types: ", ", ".join(sorted(self.assessment_types))),
+        )
+        return "\n".join([self.name, *(prefix + value for prefix, value in optional_sections if value)])
 
     def duration_minutes(self) -> Optional[int]:
         """Extract the numeric duration (in minutes) when present."""
 
-        if not self.assessment_length:
-            return None
-        match = re.findall(r"\d+", self.assessment_length)
-        if not match:
-            return None
-        try:
-            return int(match[0])
-        except ValueError:
-            return None
+        match = _DURATION_RE.search(self.assessment_length or "")
+        return int(match.group(1)) if match else None
 
     def human_readable_types(self) -> List[str]:
         """Return descriptive labels for assessment type codes."""
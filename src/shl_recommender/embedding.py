@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
 import chromadb
 import logfire
 import numpy as np
 import pandas as pd
 import huggingface_hub
+import torch
 from urllib.parse import urlparse
 
 if not hasattr(huggingface_hub, "cached_download"):
@@ -67,12 +69,13 @@ if not hasattr(huggingface_hub, "cached_download"):
 from sentence_transformers import SentenceTransformer
 
 from .config import get_settings
-from .data_models import AssessmentMetadata
+from .data_models import ASSESSMENT_TYPE_LABELS, AssessmentMetadata
 from .logging_setup import configure_logging
 from .paths import resolve_project_path
 
 
 COLLECTION_METADATA = {"hnsw:space": "cosine"}
+UPSERT_BATCH_SIZE = 200
 
 
 def _is_missing_collection_error(exc: BaseException) -> bool:
@@ -125,45 +128,140 @@ def delete_assessment_collection_if_exists(
             raise
 
 
-def load_catalog(path: str | None = None) -> List[AssessmentMetadata]:
+CATALOG_COLUMNS = (
+    "entity_id",
+    "name",
+    "url",
+    "assessment_types",
+    "description",
+    "job_levels",
+    "languages",
+    "assessment_length",
+    "remote_testing",
+    "adaptive",
+)
+
+
+# Explicit dtypes stop the reader from inferring numbers for text columns
+# (assessment_length would otherwise parse as float). "string[pyarrow]" keeps
+# the Arrow buffers as-is; plain "string" is string[python], which converts
+# every cell to a Python object and roughly doubles the read time.
+CATALOG_DTYPES = {
+    "entity_id": "string[pyarrow]",
+    "name": "string[pyarrow]",
+    "url": "string[pyarrow]",
+    "assessment_types": "string[pyarrow]",
+    "description": "string[pyarrow]",
+    "job_levels": "string[pyarrow]",
+    "languages": "string[pyarrow]",
+    "assessment_length": "string[pyarrow]",
+    "remote_testing": "boolean",
+    "adaptive": "boolean",
+}
+
+
+def _split_column(values: pd.Series, *, upper: bool = False) -> pd.Series:
+    """Split comma-separated cells into stripped, non-empty parts (missing cells -> [])."""
+    text = values.fillna("").astype(str)
+    if upper:
+        text = text.str.upper()
+    return text.str.split(",").map(lambda parts: [part.strip() for part in parts if part.strip()])
+
+
+def _optional_column(values: pd.Series, convert) -> pd.Series:
+    """Apply ``convert`` to present cells and map missing cells to ``None``."""
+    present = values.notna()
+    return values.astype(object).map(convert, na_action="ignore").astype(object).where(present, None)
+
+
+def _read_catalog_columns(path: str | None) -> pd.DataFrame:
+    """Read the catalog CSV and parse every column into its record-ready form."""
     settings = get_settings()
     csv_path = Path(path) if path else Path(settings.data_csv_path)
     resolved_csv_path = resolve_project_path(csv_path)
-    df = pd.read_csv(resolved_csv_path)
-
-    records: List[AssessmentMetadata] = []
-    for _, row in df.iterrows():
-        types = set(
-            part.strip().upper()
-            for part in str(row.get("assessment_types", "")).split(",")
-            if part.strip()
-        )
-        job_levels = [
-            part.strip()
-            for part in str(row.get("job_levels", "")).split(",")
-            if part.strip()
-        ]
-        languages = [
-            part.strip()
-            for part in str(row.get("languages", "")).split(",")
-            if part.strip()
-        ]
-
-        metadata = AssessmentMetadata(
-            entity_id=str(row.get("entity_id")),
-            name=str(row.get("name")),
-            url=str(row.get("url")),
-            assessment_types=types,
-            description=str(row.get("description")) if pd.notna(row.get("description")) else None,
+    df = pd.read_csv(resolved_csv_path, engine="pyarrow", dtype=CATALOG_DTYPES).reindex(
+        columns=CATALOG_COLUMNS
+    )
+    return pd.DataFrame(
+        {
+            "entity_id": df["entity_id"].astype(str),
+            "name": df["name"].astype(str),
+            "url": df["url"].astype(str),
+            "assessment_types": _split_column(df["assessment_types"], upper=True),
+            "description": _optional_column(df["description"], str),
+            "job_levels": _split_column(df["job_levels"]),
+            "languages": _split_column(df["languages"]),
+            "assessment_length": _optional_column(df["assessment_length"], str),
+            "remote_testing": _optional_column(df["remote_testing"], bool),
+            "adaptive": _optional_column(df["adaptive"], bool),
+        }
+    )
+
+
+def _records_from_columns(columns: pd.DataFrame) -> List[AssessmentMetadata]:
+    return [
+        AssessmentMetadata(
+            entity_id=entity_id,
+            name=name,
+            url=url,
+            assessment_types=set(types),
+            description=description,
             job_levels=job_levels,
             languages=languages,
-            assessment_length=str(row.get("assessment_length")) if pd.notna(row.get("assessment_length")) else None,
-            remote_testing=bool(row.get("remote_testing")) if not pd.isna(row.get("remote_testing")) else None,
-            adaptive=bool(row.get("adaptive")) if not pd.isna(row.get("adaptive")) else None,
+            assessment_length=assessment_length,
+            remote_testing=remote_testing,
+            adaptive=adaptive,
         )
-        records.append(metadata)
+        for (
+            entity_id,
+            name,
+            url,
+            types,
+            description,
+            job_levels,
+            languages,
+            assessment_length,
+            remote_testing,
+            adaptive,
+        ) in zip(*(columns[column] for column in CATALOG_COLUMNS))
+    ]
+
+
+def _combined_text_column(columns: pd.DataFrame) -> pd.Series:
+    """Column-wise equivalent of ``AssessmentMetadata.combined_text`` for every row."""
+    sections = (
+        ("", columns["description"].fillna("")),
+        ("Job Levels: ", columns["job_levels"].map(", ".join)),
+        ("Languages: ", columns["languages"].map(", ".join)),
+        ("Assessment Length: ", columns["assessment_length"].fillna("")),
+        ("Types: ", columns["assessment_types"].map(lambda codes: ", ".join(sorted(set(codes))))),
+    )
+    # Each present section contributes "\n<prefix><value>"; empty ones contribute nothing.
+    return columns["name"].str.cat(
+        [("\n" + prefix + values).where(values != "", "") for prefix, values in sections]
+    )
+
+
+def load_catalog(path: str | None = None) -> List[AssessmentMetadata]:
+    return _records_from_columns(_read_catalog_columns(path))
 
-    return records
+
+def load_catalog_with_documents(path: str | None = None) -> Tuple[List[AssessmentMetadata], List[str]]:
+    """Catalog records plus their embedding documents, assembled column-wise."""
+    columns = _read_catalog_columns(path)
+    return _records_from_columns(columns), _combined_text_column(columns).tolist()
+
+
+def select_embedding_device(preferred: str | None = None) -> str:
+    """Pick the configured device, else CUDA, then Apple MPS, then CPU."""
+    if preferred:
+        return preferred
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
 
 
 class EmbeddingService:
@@ -172,11 +270,23 @@ class EmbeddingService:
     def __init__(self, model_name: str | None = None) -> None:
         settings = get_settings()
         target_model = model_name or settings.embeddings_model_name
-        logfire.info("Loading embedding model", model=target_model)
-        self.model = SentenceTransformer(target_model)
+        self.device = select_embedding_device(settings.embedding_device)
+        self._batch_size = settings.embedding_batch_size
+        logfire.info("Loading embedding model", model=target_model, device=self.device)
+        self.model = SentenceTransformer(target_model, device=self.device)
+        if self.device != "cpu":
+            # FP16 halves activation bandwidth on accelerators; CPUs gain nothing from it.
+            self.model = self.model.half()
 
     def embed(self, texts: Iterable[str]) -> np.ndarray:
-        return self.model.encode(list(texts), convert_to_numpy=True, show_progress_bar=False)
+        embeddings = self.model.encode(
+            list(texts),
+            batch_size=self._batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(embeddings, dtype=np.float32)
 
 
 def build_vector_store(reset: bool = False) -> None:
@@ -191,16 +301,20 @@ def build_vector_store(reset: bool = False) -> None:
 
     collection = get_or_create_assessment_collection(client, settings.collection_name)
 
-    records = load_catalog()
+    records, documents = load_catalog_with_documents()
     embedder = EmbeddingService()
-    documents = [record.combined_text() for record in records]
-    embeddings = embedder.embed(documents)
 
     ids = [record.entity_id for record in records]
     def serialize_metadata(record: AssessmentMetadata) -> dict[str, str | bool | None]:
         def join(values: Iterable[str]) -> str | None:
-            items = [value for value in values if value]
-            return ", ".join(sorted(items)) if items else None
+            items = sorted(value for value in values if value)
+            if not items:
+                return None
+            # Known single-letter codes are stored compactly ("KPS") and decode without a
+            # split. Anything else keeps a trailing comma so it is never read as compact.
+            if all(item in ASSESSMENT_TYPE_LABELS for item in items):
+                return "".join(items)
+            return ", ".join(items) + ","
 
         return {
             "entity_id": record.entity_id,
@@ -212,13 +326,32 @@ def build_vector_store(reset: bool = False) -> None:
     metadatas = [serialize_metadata(record) for record in records]
 
     logfire.info(
-        "Upserting embeddings",
+        "Embedding and upserting",
         count=len(records),
         collection=settings.collection_name,
         chroma_path=str(resolved_chroma_path()),
     )
 
-    collection.upsert(ids=ids, embeddings=embeddings.tolist(), metadatas=metadatas, documents=documents)
+    # Encode shard n+1 while a single writer thread upserts shard n: encoding is
+    # CPU/GPU-bound, upserts are SQLite-bound. Waiting on the previous upsert
+    # before queueing the next keeps one batch in flight and surfaces errors early.
+    # chromadb 0.5 validates embeddings as Python lists, hence the per-shard tolist().
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma-upsert") as upserter:
+        pending: Future | None = None
+        for start in range(0, len(records), UPSERT_BATCH_SIZE):
+            end = start + UPSERT_BATCH_SIZE
+            embeddings = embedder.embed(documents[start:end])
+            if pending is not None:
+                pending.result()
+            pending = upserter.submit(
+                collection.upsert,
+                ids=ids[start:end],
+                embeddings=embeddings.tolist(),
+                metadatas=metadatas[start:end],
+                documents=documents[start:end],
+            )
+        if pending is not None:
+            pending.result()
 
     logfire.info("Vector store build complete", total=len(records))
 
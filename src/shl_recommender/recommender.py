@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 import threading
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Sequence, Set, Tuple
 import os
 
 import logfire
+import numpy as np
 from .config import get_settings
 from .data_models import ASSESSMENT_TYPE_LABELS, AssessmentMetadata, RecommendationItem
 from .embedding import (
@@ -17,12 +20,39 @@ from .embedding import (
     get_chroma_client,
     get_or_create_assessment_collection,
     load_catalog,
+    resolved_catalog_csv_path,
 )
 from .logging_setup import configure_logging
+from .semantic_cache import SemanticCache
 from .type_extraction import GeminiExtractionError, GeminiTypeExtractor
+from .vector_index import CatalogVectorIndex
 
 
-@dataclass
+_TYPE_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+_TYPE_EXTRACTION_CACHE_SIZE = 1024
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+@lru_cache(maxsize=4)
+def _catalog_index_cached(path: str, mtime_ns: int) -> Dict[str, AssessmentMetadata]:
+    return {record.entity_id: record for record in load_catalog(path)}
+
+
+def load_catalog_index() -> Dict[str, AssessmentMetadata]:
+    """Catalog records by entity id, parsed once per CSV path and modification time.
+
+    The mapping is shared between engines and must be treated as read-only.
+    """
+    path = resolved_catalog_csv_path()
+    return _catalog_index_cached(str(path), path.stat().st_mtime_ns)
+
+
+@dataclass(slots=True)
 class Candidate:
     id: str
     name: str
@@ -39,6 +69,72 @@ class Candidate:
         return None
 
 
+@dataclass(slots=True)
+class CandidatePool:
+    """Retrieved candidates as parallel columns; ``Candidate`` objects are built only for winners."""
+
+    ids: np.ndarray
+    names: np.ndarray
+    urls: np.ndarray
+    documents: np.ndarray
+    types: List[List[str]]
+    scores: np.ndarray
+
+    @classmethod
+    def from_columns(
+        cls,
+        ids: Sequence[str],
+        names: Sequence[str],
+        urls: Sequence[str],
+        documents: Sequence[str],
+        types: Sequence[List[str]],
+        scores: Sequence[float],
+    ) -> "CandidatePool":
+        return cls(
+            ids=np.array(ids, dtype=object),
+            names=np.array(names, dtype=object),
+            urls=np.array(urls, dtype=object),
+            documents=np.array(documents, dtype=object),
+            types=list(types),
+            scores=np.asarray(scores, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def take(self, rows: Sequence[int] | np.ndarray, scores: np.ndarray | None = None) -> "CandidatePool":
+        """Select ``rows`` (optionally replacing their scores) into a new pool."""
+        rows = np.asarray(rows, dtype=np.intp)
+        return CandidatePool(
+            ids=self.ids[rows],
+            names=self.names[rows],
+            urls=self.urls[rows],
+            documents=self.documents[rows],
+            types=[self.types[row] for row in rows.tolist()],
+            scores=self.scores[rows] if scores is None else np.asarray(scores, dtype=np.float64),
+        )
+
+    def concat(self, other: "CandidatePool") -> "CandidatePool":
+        return CandidatePool(
+            ids=np.concatenate((self.ids, other.ids)),
+            names=np.concatenate((self.names, other.names)),
+            urls=np.concatenate((self.urls, other.urls)),
+            documents=np.concatenate((self.documents, other.documents)),
+            types=self.types + other.types,
+            scores=np.concatenate((self.scores, other.scores)),
+        )
+
+    def candidate(self, row: int) -> Candidate:
+        return Candidate(
+            id=self.ids[row],
+            name=self.names[row],
+            url=self.urls[row],
+            assessment_types=self.types[row],
+            document=self.documents[row],
+            embedding_similarity=float(self.scores[row]),
+        )
+
+
 @dataclass
 class RecommendationResult:
     recommendations: List[RecommendationItem]
@@ -51,16 +147,28 @@ class RecommendationEngine:
     def __init__(self) -> None:
         configure_logging("shl-recommender")
         self.settings = get_settings()
-        self.embedder = EmbeddingService()
+        self._embedder: EmbeddingService | None = None
+        self._embedder_lock = threading.Lock()
+        self._embed_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._embed_cache_lock = threading.Lock()
+        self._type_cache: OrderedDict[str, Tuple[str, ...]] = OrderedDict()
+        self._type_cache_lock = threading.Lock()
+        self._semantic_cache: SemanticCache[CandidatePool] = SemanticCache(
+            threshold=self.settings.semantic_cache_threshold,
+            max_entries=self.settings.semantic_cache_size,
+            ttl_seconds=self.settings.semantic_cache_ttl_seconds,
+        )
         self.client = get_chroma_client()
         self._collection_refresh_lock = threading.Lock()
         self.collection = get_or_create_assessment_collection(
             self.client,
             self.settings.collection_name,
         )
+        self.vector_index = self._load_vector_index()
+        self._index_pool, self._index_rows_valid = self._prepare_index_pool(self.vector_index)
         self.catalog_index: Dict[str, AssessmentMetadata] = {}
         try:
-            self.catalog_index = {record.entity_id: record for record in load_catalog()}
+            self.catalog_index = load_catalog_index()
         except Exception:
             logfire.warn("Failed to load full catalog metadata; responses will be limited", exc_info=True)
         
@@ -79,6 +187,19 @@ class RecommendationEngine:
                 )
                 self.type_extractor = None
 
+    @property
+    def embedder(self) -> EmbeddingService:
+        """Embedding model, loaded on first use (a query-cache miss) instead of at startup."""
+        if self._embedder is None:
+            with self._embedder_lock:
+                if self._embedder is None:
+                    self._embedder = EmbeddingService()
+        return self._embedder
+
+    @embedder.setter
+    def embedder(self, embedder: EmbeddingService) -> None:
+        self._embedder = embedder
+
     def _rebuild_collection(self, reason: str | None = None) -> None:
         with self._collection_refresh_lock:
             logfire.warn(
@@ -102,15 +223,53 @@ class RecommendationEngine:
                 self.client,
                 self.settings.collection_name,
             )
+            self.vector_index = self._load_vector_index()
+            self._index_pool, self._index_rows_valid = self._prepare_index_pool(self.vector_index)
+            self._semantic_cache.clear()
+
+    def _load_vector_index(self) -> CatalogVectorIndex | None:
+        """Pull all stored vectors into memory; fall back to Chroma queries on failure."""
+        try:
+            index = CatalogVectorIndex.from_collection(
+                self.collection,
+                rescore_multiplier=self.settings.vector_rescore_multiplier,
+                binary_prefilter_min_rows=self.settings.binary_prefilter_min_rows,
+                precision=self.settings.vector_index_precision,
+            )
+        except Exception as exc:
+            logfire.warn(
+                "Failed to load in-memory vector index; querying Chroma directly",
+                collection=self.settings.collection_name,
+                error=str(exc),
+                exc_info=True,
+            )
+            return None
+        if not len(index):
+            return None
+        logfire.info("Loaded in-memory vector index", count=len(index))
+        return index
+
+    def _prepare_index_pool(
+        self, index: CatalogVectorIndex | None
+    ) -> Tuple[CandidatePool | None, np.ndarray | None]:
+        """Parse every indexed row's metadata once, so searches only gather rows and scores.
+
+        Returns the pool (aligned with index rows) and a mask of rows that have metadata.
+        """
+        if index is None:
+            return None, None
+        valid = np.fromiter((bool(metadata) for metadata in index.metadatas), dtype=bool, count=len(index))
+        pool = self._pool_from_rows(index.ids, index.metadatas, index.documents, np.zeros(len(index)), keep_all=True)
+        return pool, valid
 
     @staticmethod
     def _is_dimensionality_error(error: AttributeError) -> bool:
         message = str(error)
         return "dimensionality" in message.lower() and "attribute" in message.lower()
 
-    def _query_collection(self, query_embedding: List[float]) -> Dict[str, Any]:
+    def _query_collection(self, query_embeddings: List[List[float]]) -> Dict[str, Any]:
         query_params = {
-            "query_embeddings": [query_embedding],
+            "query_embeddings": query_embeddings,
             "n_results": self.settings.candidate_pool_size,
             "include": ["metadatas", "documents", "distances"],
         }
@@ -149,51 +308,128 @@ class RecommendationEngine:
         "S": "job simulation assessment",
     }
 
-    def _retrieve_candidates(self, query: str) -> List[Candidate]:
-        query_embedding = self.embedder.embed([query])[0].tolist()
-        results = self._query_collection(query_embedding)
-
-        ids = results.get("ids", [[]])[0]
-        metadatas = results.get("metadatas", [[]])[0]
-        documents = results.get("documents", [[]])[0]
-        distances = results.get("distances", [[]])[0]
-
-        candidates: List[Candidate] = []
-        for idx, metadata, document, distance in zip(ids, metadatas, documents, distances):
-            if not metadata:
-                continue
-            assessment_types = self._parse_assessment_types(metadata.get("assessment_types"))
-            # Convert distance to similarity (ChromaDB uses cosine distance, similarity = 1 - distance)
-            similarity = 1.0 - distance if distance is not None else 0.0
-            candidate = Candidate(
-                id=idx,
-                name=metadata.get("name", ""),
-                url=metadata.get("url", ""),
-                assessment_types=assessment_types,
-                document=document or "",
-                embedding_similarity=similarity,
-            )
-            candidates.append(candidate)
-
-        logfire.info("Retrieved candidates", count=len(candidates))
-        return candidates
+    def embed_batch(self, queries: Sequence[str]) -> np.ndarray:
+        """Encode several queries with a single forward pass of the embedding model.
+
+        Recently seen query strings are served from an in-process LRU cache; only
+        the misses are sent to the model.
+        """
+        cached: Dict[str, np.ndarray] = {}
+        with self._embed_cache_lock:
+            for query in queries:
+                embedding = self._embed_cache.get(query)
+                if embedding is not None:
+                    self._embed_cache.move_to_end(query)
+                    cached[query] = embedding
+
+        misses = list(dict.fromkeys(query for query in queries if query not in cached))
+        if misses:
+            encoded = np.asarray(self.embedder.embed(misses), dtype=np.float32)
+            encoded.setflags(write=False)
+            with self._embed_cache_lock:
+                for query, embedding in zip(misses, encoded):
+                    cached[query] = embedding
+                    self._embed_cache[query] = embedding
+                    self._embed_cache.move_to_end(query)
+                while len(self._embed_cache) > self.settings.query_embedding_cache_size:
+                    self._embed_cache.popitem(last=False)
+
+        return np.stack([cached[query] for query in queries]) if queries else np.empty((0, 0), dtype=np.float32)
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        return self.embed_batch([query])[0]
+
+    def retrieve_candidates_batch(self, queries: Sequence[str]) -> List[CandidatePool]:
+        """Retrieve candidates for many queries with one encoder call."""
+        if not queries:
+            return []
+        return self._candidates_for_embeddings(self.embed_batch(queries))
+
+    def _retrieve_candidates(self, query: str, *, use_semantic_cache: bool = True) -> CandidatePool:
+        query_embedding = self._embed_query(query)[None, :]
+        if not use_semantic_cache:
+            return self._search_embeddings(query_embedding)[0]
+        return self._candidates_for_embeddings(query_embedding)[0]
+
+    def _candidates_for_embeddings(self, query_embeddings: np.ndarray) -> List[CandidatePool]:
+        """Serve near-duplicate queries from the semantic cache and search the rest."""
+        pools: List[CandidatePool | None] = [
+            self._semantic_cache.lookup(embedding) for embedding in query_embeddings
+        ]
+        misses = [row for row, pool in enumerate(pools) if pool is None]
+        if misses:
+            logfire.debug("Semantic cache lookup", hits=len(pools) - len(misses), misses=len(misses))
+            for row, pool in zip(misses, self._search_embeddings(query_embeddings[misses])):
+                self._semantic_cache.store(query_embeddings[row], pool)
+                pools[row] = pool
+        # Pools are never mutated in place (take/concat build new ones), so cached ones are shared.
+        return pools
+
+    def _search_embeddings(self, query_embeddings: np.ndarray) -> List[CandidatePool]:
+        if self.vector_index is not None:
+            hits = self.vector_index.search_batch(query_embeddings, self.settings.candidate_pool_size)
+            return [self._candidates_from_index(rows, scores) for rows, scores in hits]
+
+        results = self._query_collection(query_embeddings.tolist())
+        return [self._candidates_from_results(results, row) for row in range(len(query_embeddings))]
+
+    def _candidates_from_index(self, rows: np.ndarray, scores: np.ndarray) -> CandidatePool:
+        keep = self._index_rows_valid[rows]
+        pool = self._index_pool.take(rows[keep], scores=scores[keep])
+        logfire.info("Retrieved candidates", count=len(pool))
+        return pool
+
+    def _candidates_from_results(self, results: Dict[str, Any], row: int) -> CandidatePool:
+        ids = (results.get("ids") or [[]])[row]
+        metadatas = (results.get("metadatas") or [[]])[row]
+        documents = (results.get("documents") or [[]])[row]
+        distances = (results.get("distances") or [[]])[row]
+
+        # Convert distance to similarity (ChromaDB uses cosine distance, similarity = 1 - distance);
+        # missing distances (None -> NaN) score 0.0.
+        similarities = 1.0 - np.nan_to_num(np.asarray(distances, dtype=np.float64), nan=1.0)
+        count = min(len(ids), len(metadatas), len(documents), len(similarities))
+        pool = self._pool_from_rows(ids[:count], metadatas[:count], documents[:count], similarities[:count])
+        logfire.info("Retrieved candidates", count=len(pool))
+        return pool
+
+    def _pool_from_rows(
+        self,
+        ids: Sequence[str],
+        metadatas: Sequence[Dict[str, Any] | None],
+        documents: Sequence[str | None],
+        similarities: np.ndarray,
+        *,
+        keep_all: bool = False,
+    ) -> CandidatePool:
+        """Build a pool from vector-store rows, dropping rows without metadata unless ``keep_all``."""
+        rows = [row for row, metadata in enumerate(metadatas) if keep_all or metadata]
+        rows_metadata = [metadatas[row] or {} for row in rows]
+        return CandidatePool.from_columns(
+            ids=[ids[row] for row in rows],
+            names=[metadata.get("name", "") for metadata in rows_metadata],
+            urls=[metadata.get("url", "") for metadata in rows_metadata],
+            documents=[documents[row] or "" for row in rows],
+            types=[self._parse_assessment_types(metadata.get("assessment_types")) for metadata in rows_metadata],
+            scores=similarities[np.asarray(rows, dtype=np.intp)],
+        )
 
     def _expand_candidates_for_types(
         self,
         query: str,
-        candidates: List[Candidate],
+        candidates: CandidatePool,
         extracted_types: List[str],
-    ) -> List[Candidate]:
+    ) -> CandidatePool:
         """Backfill retrieval when vector search omits requested assessment types."""
         if not extracted_types:
             return candidates
 
         present_types: Set[str] = set()
-        for candidate in candidates:
-            present_types.update(value.upper() for value in candidate.assessment_types)
+        for types in candidates.types:
+            present_types.update(value.upper() for value in types)
 
-        merged = list(candidates)
-        seen_ids = {candidate.id for candidate in merged}
+        merged = candidates
+        seen_ids = set(candidates.ids.tolist())
 
         for type_code in extracted_types:
             upper = type_code.upper()
@@ -201,25 +437,49 @@ class RecommendationEngine:
                 continue
             focus = self._TYPE_FOCUS_PHRASES.get(upper, ASSESSMENT_TYPE_LABELS.get(upper, upper))
             supplemental_query = f"{query}\n{focus}"
-            for candidate in self._retrieve_candidates(supplemental_query):
-                if upper not in {value.upper() for value in candidate.assessment_types}:
+            # Focus queries are near-duplicates of the original by construction; a semantic
+            # cache hit would hand back the very pool that lacks this type.
+            supplemental = self._retrieve_candidates(supplemental_query, use_semantic_cache=False)
+            for row, types in enumerate(supplemental.types):
+                if upper not in {value.upper() for value in types}:
                     continue
-                if candidate.id in seen_ids:
+                if supplemental.ids[row] in seen_ids:
                     continue
-                merged.append(candidate)
-                seen_ids.add(candidate.id)
+                merged = merged.concat(supplemental.take([row]))
+                seen_ids.add(supplemental.ids[row])
                 present_types.add(upper)
                 break
 
         return merged
 
+    def _cached_type_extraction(self, query: str) -> Tuple[str, ...]:
+        """Gemini type codes for ``query``, memoized per engine by normalized query.
+
+        The cache key is lowercased and whitespace-collapsed, but Gemini always sees
+        the original text. Failures raise and are therefore never cached.
+        """
+        key = _normalize_query(query)
+        with self._type_cache_lock:
+            cached = self._type_cache.get(key)
+            if cached is not None:
+                self._type_cache.move_to_end(key)
+                return cached
+
+        extracted = tuple(self.type_extractor.extract(query))
+        with self._type_cache_lock:
+            self._type_cache[key] = extracted
+            self._type_cache.move_to_end(key)
+            while len(self._type_cache) > _TYPE_EXTRACTION_CACHE_SIZE:
+                self._type_cache.popitem(last=False)
+        return extracted
+
     def _extract_types_from_query(self, query: str) -> List[str]:
         """Extract assessment types (A, B, C, D, E, K, P, S) from query using Gemini if available."""
         valid_types = {"A", "B", "C", "D", "E", "K", "P", "S"}
 
         if self.type_extractor and not self._gemini_disabled:
             try:
-                extracted = self.type_extractor.extract(query)
+                extracted = self._cached_type_extraction(query)
                 ordered_unique: List[str] = []
                 for type_code in extracted:
                     normalized = type_code.strip().upper()
@@ -385,73 +645,66 @@ class RecommendationEngine:
 
         return {code: {keyword.strip() for keyword in keywords if keyword.strip()} for code, keywords in synonyms.items()}
 
-    def _rank_candidates(self, candidates: List[Candidate], extracted_types: List[str]) -> List[Candidate]:
-        """Rank candidates by type match and embedding similarity."""
+    @staticmethod
+    def _score_and_match(candidates: CandidatePool, extracted_types: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(similarities, type_matches)`` arrays aligned with the pool rows."""
         type_set = {code.upper() for code in extracted_types}
-        if not type_set:
-            # If no types extracted, rank by embedding similarity only
-            return sorted(candidates, key=lambda c: c.embedding_similarity, reverse=True)
-        
-        # Rank candidates: prioritize those matching extracted types, then by similarity
-        def rank_key(candidate: Candidate) -> tuple:
-            # Check if candidate has any matching types
-            candidate_types = {t.upper() for t in candidate.assessment_types}
-            has_match = bool(candidate_types & type_set)
-            # Return (has_match, similarity) - True sorts before False, so matches come first
-            return (not has_match, -candidate.embedding_similarity)
-        
-        return sorted(candidates, key=rank_key)
+        type_matches = np.fromiter(
+            (
+                bool(type_set) and not type_set.isdisjoint(t.upper() for t in types)
+                for types in candidates.types
+            ),
+            dtype=bool,
+            count=len(candidates),
+        )
+        return candidates.scores, type_matches
+
+    @staticmethod
+    def _rank_candidates(similarities: np.ndarray, type_matches: np.ndarray) -> np.ndarray:
+        """Pool rows ranked by type match, then embedding similarity (stable, like sorted())."""
+        return np.lexsort((-similarities, ~type_matches))
 
     def _balance_by_extracted_types(
         self,
-        ranked_candidates: List[Candidate],
+        candidates: CandidatePool,
+        ranked_rows: np.ndarray,
         extracted_types: List[str],
         desired_count: int,
-    ) -> List[Candidate]:
+    ) -> List[int]:
         """Ensure each requested assessment type appears when candidates exist."""
+        ranked = ranked_rows.tolist()
         if not extracted_types or desired_count <= 0:
-            return ranked_candidates[:desired_count]
+            return ranked[:desired_count]
 
-        selected: List[Candidate] = []
+        selected: List[int] = []
         seen_ids: set[str] = set()
+        row_type_sets = {row: {value.upper() for value in candidates.types[row]} for row in ranked}
 
         for type_code in extracted_types:
             upper = type_code.upper()
-            for candidate in ranked_candidates:
-                if candidate.id in seen_ids:
+            for row in ranked:
+                if candidates.ids[row] in seen_ids:
                     continue
-                candidate_types = {value.upper() for value in candidate.assessment_types}
-                if upper in candidate_types:
-                    selected.append(candidate)
-                    seen_ids.add(candidate.id)
+                if upper in row_type_sets[row]:
+                    selected.append(row)
+                    seen_ids.add(candidates.ids[row])
                     break
 
-        for candidate in ranked_candidates:
+        for row in ranked:
             if len(selected) >= desired_count:
                 break
-            if candidate.id not in seen_ids:
-                selected.append(candidate)
-                seen_ids.add(candidate.id)
+            if candidates.ids[row] not in seen_ids:
+                selected.append(row)
+                seen_ids.add(candidates.ids[row])
 
         return selected[:desired_count]
 
-    def _determine_result_count(self, candidates: List[Candidate], extracted_types: List[str]) -> int:
+    @staticmethod
+    def _determine_result_count(type_match_count: int) -> int:
         """Determine optimal number of results (5-10) based on match quality."""
-        if not candidates:
-            return 5
-        
         min_results = 5
         max_results = 10
-        
-        # Count candidates matching extracted types
-        type_match_count = 0
-        type_set = {code.upper() for code in extracted_types}
-        if type_set:
-            for candidate in candidates:
-                candidate_types = {t.upper() for t in candidate.assessment_types}
-                if candidate_types & type_set:
-                    type_match_count += 1
-        
+
         # Simple logic: return more results if we have good type matches
         if type_match_count >= 10:
             return max_results
@@ -467,7 +720,11 @@ class RecommendationEngine:
         if isinstance(raw, list):
             return [str(item).strip().upper() for item in raw if str(item).strip()]
         if isinstance(raw, str):
-            return [part.strip().upper() for part in raw.split(",") if part.strip()]
+            codes = raw.strip().upper()
+            if "," not in codes and codes and all(code in ASSESSMENT_TYPE_LABELS for code in codes):
+                # Compact single-letter codes, e.g. "KPS"
+                return list(codes)
+            return [part for part in _TYPE_SPLIT_RE.split(codes) if part]
         return []
 
     def recommend(
@@ -476,34 +733,39 @@ class RecommendationEngine:
         *,
         min_results: int | None = None,
         max_results: int | None = None,
+        candidates: CandidatePool | None = None,
     ) -> RecommendationResult:
         # Step 1: Extract types from query (Gemini + heuristics)
         extracted_types = self._extract_types_from_query(query)
         
-        # Step 2: Retrieve candidates using vector search
-        candidates = self._retrieve_candidates(query)
+        # Step 2: Retrieve candidates using vector search (unless a batch already did)
+        if candidates is None:
+            candidates = self._retrieve_candidates(query)
         candidates = self._expand_candidates_for_types(query, candidates, extracted_types)
         if not candidates:
             return RecommendationResult(recommendations=[], extracted_types=extracted_types)
 
         # Step 3: Rank candidates (type matches first, then similarity backfill)
-        ranked_candidates = self._rank_candidates(candidates, extracted_types)
-        
+        similarities, type_matches = self._score_and_match(candidates, extracted_types)
+        ranked_rows = self._rank_candidates(similarities, type_matches)
+
         # Step 4: Determine optimal number of results based on match quality
-        optimal_count = self._determine_result_count(ranked_candidates, extracted_types)
+        optimal_count = self._determine_result_count(int(type_matches.sum()))
         lower_bound = min_results if min_results is not None else 5
         upper_bound = max_results if max_results is not None else min(self.settings.recommendation_limit, 10)
         upper_bound = max(1, min(upper_bound, 10))
         lower_bound = max(1, min(lower_bound, upper_bound))
         desired_count = max(lower_bound, min(optimal_count, upper_bound))
-        desired_count = min(desired_count, len(ranked_candidates))
-        ranked_candidates = self._balance_by_extracted_types(
-            ranked_candidates,
+        desired_count = min(desired_count, len(candidates))
+        selected_rows = self._balance_by_extracted_types(
+            candidates,
+            ranked_rows,
             extracted_types,
             desired_count,
         )
 
-        # Step 5: Build recommendation items
+        # Step 5: Materialize only the selected rows and build recommendation items
+        ranked_candidates = [candidates.candidate(row) for row in selected_rows]
         recommendations = [self._build_recommendation_item(candidate) for candidate in ranked_candidates]
 
         # Log recommended assessments
@@ -525,6 +787,25 @@ class RecommendationEngine:
 
         return RecommendationResult(recommendations=recommendations, extracted_types=extracted_types)
 
+    def recommend_batch(
+        self,
+        queries: Sequence[str],
+        *,
+        min_results: int | None = None,
+        max_results: int | None = None,
+    ) -> List[RecommendationResult]:
+        """Recommend for many queries, embedding them all in one encoder call."""
+        candidate_pools = self.retrieve_candidates_batch(queries)
+        return [
+            self.recommend(
+                query,
+                min_results=min_results,
+                max_results=max_results,
+                candidates=candidates,
+            )
+            for query, candidates in zip(queries, candidate_pools)
+        ]
+
     def _build_recommendation_item(self, candidate: Candidate) -> RecommendationItem:
         metadata = self.catalog_index.get(candidate.id)
         if metadata:
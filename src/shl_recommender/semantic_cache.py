@@ -0,0 +1,91 @@
+"""Semantic (near-duplicate) query cache keyed by embedding similarity."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Generic, List, TypeVar
+
+import numpy as np
+
+
+T = TypeVar("T")
+
+
+class SemanticCache(Generic[T]):
+    """Reuse results for queries whose embeddings are near-duplicates of a recent one.
+
+    Cached query embeddings live in one preallocated ``(max_entries, d)`` matrix,
+    so a lookup is a single GEMV against every entry. A hit requires cosine
+    similarity of at least ``threshold`` with an entry younger than
+    ``ttl_seconds``. When full, expired entries are replaced first, then the
+    least recently used one.
+    """
+
+    def __init__(self, *, threshold: float, max_entries: int, ttl_seconds: float) -> None:
+        self.threshold = threshold
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._embeddings: np.ndarray | None = None
+        self._payloads: List[T | None] = [None] * self.max_entries
+        self._created = np.zeros(self.max_entries, dtype=np.float64)
+        self._last_used = np.zeros(self.max_entries, dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _expired(self, now: float) -> np.ndarray:
+        return (now - self._created[: self._size]) > self.ttl_seconds
+
+    def lookup(self, embedding: np.ndarray) -> T | None:
+        if not self.max_entries:
+            return None
+        query = self._normalize(embedding)
+        with self._lock:
+            if not self._size or self._embeddings is None or self._embeddings.shape[1] != query.shape[0]:
+                return None
+            now = time.monotonic()
+            similarities = self._embeddings[: self._size] @ query
+            similarities[self._expired(now)] = -np.inf
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            self._last_used[best] = now
+            return self._payloads[best]
+
+    def store(self, embedding: np.ndarray, payload: T) -> None:
+        if not self.max_entries:
+            return
+        query = self._normalize(embedding)
+        with self._lock:
+            if self._embeddings is None or self._embeddings.shape[1] != query.shape[0]:
+                self._embeddings = np.zeros((self.max_entries, query.shape[0]), dtype=np.float32)
+                self._payloads = [None] * self.max_entries
+                self._size = 0
+
+            now = time.monotonic()
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                recency = np.where(self._expired(now), -np.inf, self._last_used)
+                slot = int(np.argmin(recency))
+
+            self._embeddings[slot] = query
+            self._payloads[slot] = payload
+            self._created[slot] = now
+            self._last_used[slot] = now
+
+    def clear(self) -> None:
+        with self._lock:
+            self._embeddings = None
+            self._payloads = [None] * self.max_entries
+            self._size = 0
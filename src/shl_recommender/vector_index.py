@@ -0,0 +1,171 @@
+"""In-memory catalog vector index (NumPy only, no heavy dependencies)."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Literal, Sequence, Tuple
+
+import numpy as np
+
+
+VectorPrecision = Literal["float32", "float16", "int8"]
+
+
+# Reduced-precision rows are upcast to FP32 this many at a time, so the
+# temporary stays cache-sized instead of re-materializing the full FP32 matrix.
+_SCORE_BLOCK_ROWS = 2048
+
+# Number of set bits for every possible byte value, used to popcount XOR-ed codes.
+_POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def binary_quantize(embeddings: np.ndarray) -> np.ndarray:
+    """Pack the sign bit of every dimension into uint8 codes (32x smaller than FP32)."""
+    return np.packbits(np.asarray(embeddings) > 0, axis=-1)
+
+
+def hamming_distances(codes: np.ndarray, query_code: np.ndarray) -> np.ndarray:
+    """Hamming distance between each packed row in ``codes`` and ``query_code``."""
+    return _POPCOUNT_TABLE[np.bitwise_xor(codes, query_code)].sum(axis=1, dtype=np.int32)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` largest scores, best first, via an O(n) ``argpartition``."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def scalar_quantize(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantize each row to int8 with its own scale; returns ``(codes, row_scales)``."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.round(matrix / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class CatalogVectorIndex:
+    """Catalog embeddings held in memory for retrieval without a Chroma round-trip.
+
+    Rows are L2-normalized and stored in ``precision`` (FP32, FP16, or int8 with a
+    per-row scale) alongside sign-packed binary codes; scores are always
+    accumulated in FP32. Ranking by cosine is insensitive to FP16 rounding and
+    int8 costs well under 1% recall, for half / a quarter of the memory. Reduced
+    precision only saves memory: NumPy has no FP16/int8 matmul, so those rows
+    are upcast to FP32 (in blocks) on every query, making search several times
+    slower than FP32 storage. Use them only when memory matters more than latency.
+    Small catalogs are searched exactly with one inner-product GEMV over the
+    whole matrix (the ``IndexFlatIP`` approach). Once the index holds at least
+    ``binary_prefilter_min_rows`` rows, search first shortlists
+    ``k * rescore_multiplier`` rows by Hamming distance over the binary codes
+    and rescores only that shortlist with FP32 cosine similarity.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        embeddings: Any,
+        metadatas: Sequence[Dict[str, Any] | None],
+        documents: Sequence[str | None],
+        *,
+        rescore_multiplier: int = 4,
+        binary_prefilter_min_rows: int = 10_000,
+        precision: VectorPrecision = "float32",
+    ) -> None:
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(ids):
+            raise ValueError("Embeddings must be a 2-D array with one row per id.")
+
+        self.ids: List[str] = list(ids)
+        self.metadatas: List[Dict[str, Any] | None] = list(metadatas)
+        self.documents: List[str | None] = list(documents)
+        normalized = _normalize_rows(matrix)
+        self.binary_codes = binary_quantize(normalized)
+        self.precision = precision
+        self.row_scales: np.ndarray | None = None
+        if precision == "int8":
+            self.embeddings, self.row_scales = scalar_quantize(normalized)
+        elif precision in ("float16", "float32"):
+            self.embeddings = np.ascontiguousarray(normalized, dtype=precision)
+        else:
+            raise ValueError(f"Unsupported vector precision: {precision!r}")
+        self.rescore_multiplier = max(1, rescore_multiplier)
+        self.binary_prefilter_min_rows = binary_prefilter_min_rows
+
+    @classmethod
+    def from_collection(cls, collection: Any, **kwargs: Any) -> "CatalogVectorIndex":
+        """Load every stored vector from a Chroma collection in a single ``get`` call."""
+        dump = collection.get(include=["embeddings", "metadatas", "documents"])
+        ids = dump.get("ids") or []
+        return cls(
+            ids,
+            dump.get("embeddings") if ids else np.empty((0, 0), dtype=np.float32),
+            dump.get("metadatas") or [None] * len(ids),
+            dump.get("documents") or [None] * len(ids),
+            **kwargs,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query_embedding: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(row_indices, cosine_similarities)`` of the top ``k`` rows, best first."""
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+        query = _normalize_rows(np.asarray(query_embedding, dtype=np.float32).reshape(-1))
+        if len(self) < self.binary_prefilter_min_rows:
+            scores = self._scores(query)
+            order = top_k_indices(scores, k)
+            return order, scores[order]
+
+        shortlist_size = min(len(self), k * self.rescore_multiplier)
+        distances = hamming_distances(self.binary_codes, binary_quantize(query))
+        shortlist = top_k_indices(-distances, shortlist_size)
+
+        scores = self._scores(query, shortlist)
+        order = top_k_indices(scores, k)
+        return shortlist[order], scores[order]
+
+    def search_batch(self, query_embeddings: np.ndarray, k: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """``search`` for several queries; exact search scores them all in one GEMM."""
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if len(self) >= self.binary_prefilter_min_rows or min(k, len(self)) <= 0:
+            return [self.search(query, k) for query in queries]
+
+        scores = self._scores(_normalize_rows(queries).T)
+        results = []
+        for column in range(scores.shape[1]):
+            order = top_k_indices(scores[:, column], k)
+            results.append((order, scores[order, column]))
+        return results
+
+    def _scores(self, query: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """FP32 cosine scores for ``rows`` (all rows when omitted).
+
+        ``query`` is a single vector, or a ``(d, B)`` matrix for ``(N, B)`` scores.
+        """
+        matrix = self.embeddings if rows is None else self.embeddings[rows]
+        if matrix.dtype == np.float32:
+            scores = matrix @ query
+        else:
+            scores = np.empty((len(matrix),) + query.shape[1:], dtype=np.float32)
+            for start in range(0, len(matrix), _SCORE_BLOCK_ROWS):
+                block = slice(start, start + _SCORE_BLOCK_ROWS)
+                scores[block] = matrix[block].astype(np.float32) @ query
+        if self.row_scales is not None:
+            scales = self.row_scales if rows is None else self.row_scales[rows]
+            scores *= scales if scores.ndim == 1 else scales[:, None]
+        return scores
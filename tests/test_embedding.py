@@ -0,0 +1,45 @@
+"""Unit tests for catalog loading helpers."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.shl_recommender.embedding import load_catalog, load_catalog_with_documents
+
+
+_CATALOG_CSV = """entity_id,name,url,assessment_types,description,job_levels,languages,assessment_length,remote_testing,adaptive
+1,Java 8,https://example.com/java/,"K, p","Java knowledge test","Mid-Professional, Graduate",English (USA),Approximate Completion Time in minutes = 18,True,
+2,OPQ,https://example.com/opq/,P,,,,,True,True
+"""
+
+
+class TestCatalogLoading(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "catalog.csv"
+        self.path.write_text(_CATALOG_CSV, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_load_catalog_parses_columns(self) -> None:
+        java, opq = load_catalog(str(self.path))
+
+        self.assertEqual(java.entity_id, "1")
+        self.assertEqual(java.assessment_types, {"K", "P"})
+        self.assertEqual(java.job_levels, ["Mid-Professional", "Graduate"])
+        self.assertTrue(java.remote_testing)
+        self.assertIsNone(java.adaptive)
+        self.assertIsNone(opq.description)
+        self.assertEqual(opq.job_levels, [])
+        self.assertEqual(opq.duration_minutes(), None)
+
+    def test_documents_match_combined_text(self) -> None:
+        records, documents = load_catalog_with_documents(str(self.path))
+        self.assertEqual(documents, [record.combined_text() for record in records])
+
+
+if __name__ == "__main__":
+    unittest.main()
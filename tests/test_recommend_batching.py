@@ -0,0 +1,74 @@
+"""Tests for /recommend micro-batching against a fake engine."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from backend import main
+from src.shl_recommender.data_models import RecommendationItem
+from src.shl_recommender.recommender import RecommendationResult
+
+
+class _FakeEngine:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def retrieve_candidates_batch(self, queries):
+        with self._lock:
+            self.batches.append(list(queries))
+        if "boom" in queries:
+            raise RuntimeError("retrieval failed")
+        return [f"pool:{query}" for query in queries]
+
+    def recommend(self, query, *, candidates):
+        item = RecommendationItem(name=candidates, url="https://www.shl.com/products/fake/")
+        return RecommendationResult(recommendations=[item], extracted_types=[])
+
+
+@pytest.fixture()
+def fake_engine(monkeypatch: pytest.MonkeyPatch) -> _FakeEngine:
+    engine = _FakeEngine()
+    # A long wait makes every batch close on size, so batch shapes are deterministic.
+    monkeypatch.setattr(main, "_batcher", main.RecommendationBatcher(max_batch=4, max_wait_ms=5_000))
+    main.app.dependency_overrides[main.get_engine] = lambda: engine
+    yield engine
+    main.app.dependency_overrides.pop(main.get_engine, None)
+
+
+async def _post_all(queries: list[str]) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=main.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(
+            *(client.post("/recommend", json={"query": query}) for query in queries)
+        )
+    await main._batcher.stop()
+    return responses
+
+
+def test_concurrent_requests_share_batches(fake_engine: _FakeEngine) -> None:
+    queries = [f"query {idx}" for idx in range(12)]
+
+    responses = asyncio.run(_post_all(queries))
+
+    assert [len(batch) for batch in fake_engine.batches] == [4, 4, 4]
+    assert sorted(q for batch in fake_engine.batches for q in batch) == sorted(queries)
+    for query, response in zip(queries, responses):
+        assert response.status_code == 200, response.text
+        assert response.json()["recommended_assessments"][0]["name"] == f"pool:{query}"
+
+
+def test_batch_failure_reaches_only_its_callers(fake_engine: _FakeEngine) -> None:
+    queries = ["a", "b", "c", "boom"]
+
+    failed = asyncio.run(_post_all(queries))
+    # A fresh event loop (like a restarted app) keeps working after the failure.
+    recovered = asyncio.run(_post_all(["d", "e", "f", "g"]))
+
+    assert [response.status_code for response in failed] == [500, 500, 500, 500]
+    assert [response.status_code for response in recovered] == [200, 200, 200, 200]
+    assert [len(batch) for batch in fake_engine.batches] == [4, 4]
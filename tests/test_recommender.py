@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
+import threading
 import unittest
+from collections import OrderedDict
 
-from src.shl_recommender.recommender import RecommendationEngine
+import numpy as np
+
+from src.shl_recommender.config import get_settings
+from src.shl_recommender.recommender import CandidatePool, RecommendationEngine
+from src.shl_recommender.semantic_cache import SemanticCache
+
+
+class _CountingEmbedder:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts):
+        batch = list(texts)
+        self.calls.append(batch)
+        return np.array([[float(len(text)), 1.0] for text in batch], dtype=np.float32)
 
 
 class TestRecommendationHelpers(unittest.TestCase):
@@ -12,6 +28,14 @@ class TestRecommendationHelpers(unittest.TestCase):
         result = RecommendationEngine._parse_assessment_types("a, K, p")
         self.assertEqual(result, ["A", "K", "P"])
 
+    def test_parse_assessment_types_from_compact_codes(self) -> None:
+        result = RecommendationEngine._parse_assessment_types("kPS")
+        self.assertEqual(result, ["K", "P", "S"])
+
+    def test_parse_assessment_types_keeps_unknown_codes_whole(self) -> None:
+        self.assertEqual(RecommendationEngine._parse_assessment_types("AB,"), ["AB"])
+        self.assertEqual(RecommendationEngine._parse_assessment_types("XK"), ["XK"])
+
     def test_parse_assessment_types_from_list(self) -> None:
         result = RecommendationEngine._parse_assessment_types(["c", "e"])
         self.assertEqual(result, ["C", "E"])
@@ -53,6 +77,77 @@ class TestRecommendationHelpers(unittest.TestCase):
         self.assertIn("P", types)
         self.assertIn("A", types)
 
+    def test_embed_batch_only_encodes_cache_misses(self) -> None:
+        engine = RecommendationEngine.__new__(RecommendationEngine)
+        engine.settings = get_settings()
+        engine._embed_cache = OrderedDict()
+        engine._embed_cache_lock = threading.Lock()
+        engine.embedder = _CountingEmbedder()
+
+        first = engine.embed_batch(["java", "sales"])
+        second = engine.embed_batch(["sales", "python", "python"])
+
+        self.assertEqual(engine.embedder.calls, [["java", "sales"], ["python"]])
+        self.assertEqual(second.shape, (3, 2))
+        np.testing.assert_array_equal(first[1], second[0])
+
+    def test_rank_candidates_puts_type_matches_first(self) -> None:
+        pool = CandidatePool.from_columns(
+            ids=["1", "2", "3", "4"],
+            names=["a", "b", "c", "d"],
+            urls=["", "", "", ""],
+            documents=["", "", "", ""],
+            types=[["K"], ["p"], ["P"], []],
+            scores=[0.9, 0.4, 0.7, 0.9],
+        )
+
+        similarities, type_matches = RecommendationEngine._score_and_match(pool, ["P"])
+        by_type = RecommendationEngine._rank_candidates(similarities, type_matches)
+        similarities, no_types = RecommendationEngine._score_and_match(pool, [])
+        by_similarity = RecommendationEngine._rank_candidates(similarities, no_types)
+
+        self.assertEqual(type_matches.tolist(), [False, True, True, False])
+        self.assertEqual(pool.ids[by_type].tolist(), ["3", "2", "1", "4"])
+        self.assertEqual(pool.ids[by_similarity].tolist(), ["1", "4", "3", "2"])
+
+    def test_candidate_pool_take_and_materialize(self) -> None:
+        pool = CandidatePool.from_columns(
+            ids=["1", "2"],
+            names=["a", "b"],
+            urls=["u1", "u2"],
+            documents=["a\nfirst", "b\nsecond"],
+            types=[["K"], ["P"]],
+            scores=[0.1, 0.2],
+        )
+
+        merged = pool.take([1]).concat(pool.take([0], scores=np.array([0.5])))
+        candidate = merged.candidate(1)
+
+        self.assertEqual(merged.ids.tolist(), ["2", "1"])
+        self.assertEqual((candidate.id, candidate.url, candidate.assessment_types), ("1", "u1", ["K"]))
+        self.assertAlmostEqual(candidate.embedding_similarity, 0.5)
+        self.assertEqual(candidate.short_description(), "first")
+
+    def test_type_backfill_bypasses_semantic_cache(self) -> None:
+        engine = RecommendationEngine.__new__(RecommendationEngine)
+        engine._semantic_cache = SemanticCache(threshold=0.5, max_entries=4, ttl_seconds=60)
+        engine.embed_batch = lambda queries: np.ones((len(queries), 2), dtype=np.float32)
+        original = CandidatePool.from_columns(["1"], ["java"], [""], [""], [["K"]], [0.9])
+        personality = CandidatePool.from_columns(["2"], ["opq"], [""], [""], [["P"]], [0.6])
+        engine._semantic_cache.store(np.ones(2), original)
+        searched: list[int] = []
+
+        def search(embeddings):
+            searched.append(len(embeddings))
+            return [personality]
+
+        engine._search_embeddings = search
+        merged = engine._expand_candidates_for_types("java developer", original, ["P"])
+
+        self.assertEqual(searched, [1])
+        self.assertEqual(merged.ids.tolist(), ["1", "2"])
+        self.assertEqual(len(engine._semantic_cache), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
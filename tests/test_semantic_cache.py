@@ -0,0 +1,44 @@
+"""Unit tests for the semantic (near-duplicate) query cache."""
+
+from __future__ import annotations
+
+import itertools
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.shl_recommender.semantic_cache import SemanticCache
+
+
+class TestSemanticCache(unittest.TestCase):
+    def test_near_duplicate_query_hits(self) -> None:
+        cache: SemanticCache[str] = SemanticCache(threshold=0.95, max_entries=4, ttl_seconds=60)
+        cache.store(np.array([1.0, 0.0, 0.0]), "java")
+        self.assertEqual(cache.lookup(np.array([2.0, 0.1, 0.0])), "java")
+        self.assertIsNone(cache.lookup(np.array([0.0, 1.0, 0.0])))
+
+    def test_expired_entries_miss(self) -> None:
+        cache: SemanticCache[str] = SemanticCache(threshold=0.95, max_entries=4, ttl_seconds=10)
+        with mock.patch("src.shl_recommender.semantic_cache.time.monotonic", return_value=100.0):
+            cache.store(np.array([1.0, 0.0]), "stale")
+        with mock.patch("src.shl_recommender.semantic_cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.lookup(np.array([1.0, 0.0])))
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: SemanticCache[str] = SemanticCache(threshold=0.95, max_entries=2, ttl_seconds=60)
+        clock = itertools.count(1.0)
+        with mock.patch(
+            "src.shl_recommender.semantic_cache.time.monotonic", side_effect=lambda: next(clock)
+        ):
+            cache.store(np.array([1.0, 0.0, 0.0]), "a")
+            cache.store(np.array([0.0, 1.0, 0.0]), "b")
+            cache.lookup(np.array([1.0, 0.0, 0.0]))
+            cache.store(np.array([0.0, 0.0, 1.0]), "c")
+
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.lookup(np.array([1.0, 0.0, 0.0])), "a")
+            self.assertIsNone(cache.lookup(np.array([0.0, 1.0, 0.0])))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Unit tests for the in-memory catalog vector index."""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from src.shl_recommender.vector_index import (
+    CatalogVectorIndex,
+    binary_quantize,
+    hamming_distances,
+    scalar_quantize,
+    top_k_indices,
+)
+
+
+def _make_index(**kwargs) -> CatalogVectorIndex:
+    rng = np.random.default_rng(7)
+    embeddings = rng.normal(size=(50, 32)).astype(np.float32)
+    ids = [str(idx) for idx in range(50)]
+    metadatas = [{"name": f"Assessment {idx}"} for idx in range(50)]
+    documents = [f"doc {idx}" for idx in range(50)]
+    return CatalogVectorIndex(ids, embeddings, metadatas, documents, **kwargs)
+
+
+class TestBinaryQuantization(unittest.TestCase):
+    def test_binary_quantize_packs_sign_bits(self) -> None:
+        codes = binary_quantize(np.array([[1.0, -1.0, 0.5, -0.5, 2.0, -2.0, 0.1, -0.1]]))
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertEqual(codes.tolist(), [[0b10101010]])
+
+    def test_hamming_distances(self) -> None:
+        codes = np.array([[0b00000000], [0b11110000], [0b11111111]], dtype=np.uint8)
+        query = np.array([0b00000000], dtype=np.uint8)
+        self.assertEqual(hamming_distances(codes, query).tolist(), [0, 4, 8])
+
+
+class TestTopK(unittest.TestCase):
+    def test_top_k_indices_orders_best_first(self) -> None:
+        scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3], dtype=np.float32)
+        self.assertEqual(top_k_indices(scores, 3).tolist(), [1, 3, 2])
+
+    def test_top_k_indices_handles_k_bounds(self) -> None:
+        scores = np.array([0.2, 0.4], dtype=np.float32)
+        self.assertEqual(top_k_indices(scores, 5).tolist(), [1, 0])
+        self.assertEqual(top_k_indices(scores, 0).tolist(), [])
+
+
+class TestCatalogVectorIndex(unittest.TestCase):
+    def test_search_returns_exact_match_first(self) -> None:
+        index = _make_index()
+        rows, scores = index.search(index.embeddings[12] * 3.0, 5)
+        self.assertEqual(rows[0], 12)
+        self.assertAlmostEqual(float(scores[0]), 1.0, places=5)
+        self.assertTrue(np.all(np.diff(scores) <= 0))
+
+    def test_binary_prefilter_matches_exact_top_hit(self) -> None:
+        exact = _make_index()
+        prefiltered = _make_index(binary_prefilter_min_rows=1)
+        query = exact.embeddings[30]
+        self.assertEqual(exact.search(query, 3)[0][0], prefiltered.search(query, 3)[0][0])
+
+    def test_exact_search_orders_all_rows_by_cosine(self) -> None:
+        index = _make_index()
+        query = index.embeddings[5] + index.embeddings[6]
+        rows, scores = index.search(query, len(index))
+        expected = np.argsort(-(index.embeddings @ (query / np.linalg.norm(query))), kind="stable")
+        self.assertEqual(rows.tolist(), expected.tolist())
+
+    def test_search_batch_matches_single_searches(self) -> None:
+        for index in (_make_index(), _make_index(precision="int8")):
+            queries = index.embeddings[[3, 17, 41]].astype(np.float32)
+            for (rows, scores), query in zip(index.search_batch(queries, 4), queries):
+                expected_rows, expected_scores = index.search(query, 4)
+                self.assertEqual(rows.tolist(), expected_rows.tolist())
+                np.testing.assert_allclose(scores, expected_scores, rtol=1e-5)
+
+    def test_search_clamps_k_to_index_size(self) -> None:
+        index = _make_index()
+        rows, scores = index.search(index.embeddings[0], 500)
+        self.assertEqual(len(rows), len(index))
+        self.assertEqual(len(scores), len(index))
+
+    def test_reduced_precision_keeps_top_hits(self) -> None:
+        reference = _make_index()
+        query = reference.embeddings[8] + 0.1 * reference.embeddings[9]
+        expected_rows, expected_scores = reference.search(query, 3)
+        for precision in ("float16", "int8"):
+            index = _make_index(precision=precision)
+            rows, scores = index.search(query, 3)
+            self.assertEqual(rows[0], expected_rows[0], precision)
+            np.testing.assert_allclose(scores, expected_scores, atol=2e-2)
+
+    def test_scalar_quantize_round_trips(self) -> None:
+        matrix = np.array([[0.5, -0.25, 0.0], [0.0, 0.0, 0.0]], dtype=np.float32)
+        codes, scales = scalar_quantize(matrix)
+        self.assertEqual(codes.dtype, np.int8)
+        np.testing.assert_allclose(codes * scales[:, None], matrix, atol=1e-2)
+
+    def test_rejects_mismatched_ids(self) -> None:
+        with self.assertRaises(ValueError):
+            CatalogVectorIndex(["a"], np.zeros((2, 4)), [None], [None])
+
+
+if __name__ == "__main__":
+    unittest.main()